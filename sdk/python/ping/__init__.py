@@ -4,7 +4,8 @@ PING - Agent-to-Agent Messenger SDK
 Simple A2A communication for AI agents.
 """
 
-from .client import PingClient, PingError
+from .client import PingClient, PingError, configure_pool
+from .aclient import AsyncPingClient
 
 __version__ = "0.1.0"
-__all__ = ["PingClient", "PingError", "__version__"]
+__all__ = ["PingClient", "AsyncPingClient", "PingError", "configure_pool", "__version__"]
@@ -0,0 +1,313 @@
+"""
+PING Python SDK Async Client
+
+asyncio variant of PingClient built on aiohttp (pip install ping-a2a[async]).
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Optional, List, Dict, Any, AsyncIterator, Sequence, Set, Tuple
+
+from .client import (
+    _BaseClient,
+    PingError,
+    Agent,
+    Message,
+    Contact,
+    _index_directory,
+    _parse_agent,
+    _parse_contact,
+    _parse_message,
+)
+
+# Optional: aiohttp is only needed for the async client
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+
+class AsyncPingClient(_BaseClient):
+    """
+    PING SDK Async Client
+    
+    PingClient's API with every network method a coroutine. One aiohttp
+    session (and its keep-alive connections) is reused across calls, so
+    many sends and inbox polls can overlap on a single event loop.
+    
+    The thread-based parts of PingClient are not available: the transport,
+    pool, flush_ms and warmup options, enqueue() and flush() (gather
+    sends or use send_many() instead), and inbox(stream=True).
+    
+    Example:
+        async with AsyncPingClient() as client:
+            client.generate_keys()
+            agent = await client.register(name="My Agent")
+            await client.text(recipient_id, "Hello!")
+            async for msg in client.stream_inbox():
+                print(msg.payload)
+    """
+    
+    def __init__(
+        self,
+        base_url: str = "http://localhost:3100",
+        private_key: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        agent_cache_ttl: float = 60.0,
+    ):
+        if not AIOHTTP_AVAILABLE:
+            raise PingError("aiohttp not installed. Run: pip install ping-a2a[async]", 500)
+        
+        super().__init__(base_url, private_key, agent_id, agent_cache_ttl)
+        # Created lazily so it binds to the running event loop
+        self._session: Optional[Any] = None
+    
+    async def close(self) -> None:
+        """Close the HTTP session and its connections"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def __aenter__(self) -> "AsyncPingClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+    
+    # ═══════════════════════════════════════════════════════════════
+    #                         AGENTS
+    # ═══════════════════════════════════════════════════════════════
+    
+    async def register(
+        self,
+        name: str,
+        provider: str = "python",
+        capabilities: Optional[List[str]] = None,
+        webhook_url: Optional[str] = None,
+        is_public: bool = False,
+    ) -> Agent:
+        """Register as a new agent"""
+        data = await self._request("POST", "/agents", self._registration(
+            name, provider, capabilities, webhook_url, is_public,
+        ))
+        
+        self.agent_id = data["id"]
+        return _parse_agent(data)
+    
+    async def get_agent(self, agent_id: str) -> Agent:
+        """Get agent info by ID (cached for agent_cache_ttl seconds)"""
+        agent = self._cached_agent(agent_id)
+        if agent is None:
+            data = await self._request("GET", f"/agents/{agent_id}")
+            agent = self._cache_agent(_parse_agent(data))
+        return agent
+    
+    async def delete_agent(self) -> None:
+        """Delete this agent"""
+        self._require_agent()
+        await self._request_url("DELETE", self._agent_url)
+        self._agent_cache.pop(self._agent_id, None)
+        self.agent_id = ""
+    
+    # ═══════════════════════════════════════════════════════════════
+    #                         DIRECTORY
+    # ═══════════════════════════════════════════════════════════════
+    
+    async def directory(self) -> List[Dict[str, Any]]:
+        """List public agents"""
+        return await self._request("GET", "/directory")
+    
+    async def directory_index(self) -> SimpleNamespace:
+        """List public agents indexed by capability and provider"""
+        return _index_directory(await self.directory())
+    
+    async def search(
+        self,
+        query: Optional[str] = None,
+        capability: Optional[str] = None,
+        provider: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Search agents"""
+        return await self._request("GET", self._search_path(query, capability, provider))
+    
+    # ═══════════════════════════════════════════════════════════════
+    #                         CONTACTS
+    # ═══════════════════════════════════════════════════════════════
+    
+    async def contacts(self) -> List[Contact]:
+        """Get contacts"""
+        self._require_agent()
+        data = await self._request_url("GET", self._contacts_url)
+        return [_parse_contact(c) for c in data]
+    
+    async def add_contact(
+        self,
+        contact_id: str,
+        alias: Optional[str] = None,
+        notes: Optional[str] = None,
+    ) -> None:
+        """Add a contact"""
+        self._require_agent()
+        await self._request_url("POST", self._contacts_url, {
+            "contactId": contact_id,
+            "alias": alias,
+            "notes": notes,
+        })
+    
+    async def remove_contact(self, contact_id: str) -> None:
+        """Remove a contact"""
+        self._require_agent()
+        await self._request_url("DELETE", f"{self._contacts_url}/{contact_id}")
+    
+    # ═══════════════════════════════════════════════════════════════
+    #                         MESSAGES
+    # ═══════════════════════════════════════════════════════════════
+    
+    async def send(
+        self,
+        to: str,
+        msg_type: str,
+        payload: Optional[Dict[str, Any]] = None,
+        reply_to: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Send a message"""
+        self._require_agent()
+        self._require_keys()
+        
+        message = self._build_message(to, msg_type, payload, reply_to)
+        return await self._request_url("POST", self._messages_url, message)
+    
+    async def send_many(
+        self,
+        targets: Sequence[Tuple[Any, ...]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several messages at once
+        
+        Each target is a (to, msg_type[, payload[, reply_to]]) tuple. All
+        messages are signed up front, then posted concurrently on the event
+        loop. Results are in submission order.
+        """
+        self._require_agent()
+        self._require_keys()
+        
+        messages = [self._build_message(*target) for target in targets]
+        return list(await asyncio.gather(*(
+            self._request_url("POST", self._messages_url, message)
+            for message in messages
+        )))
+    
+    async def inbox(self, include_all: bool = False) -> List[Message]:
+        """Get inbox (unacknowledged messages)"""
+        self._require_agent()
+        data = await self._request_url("GET", self._inbox_request_url(include_all))
+        return [_parse_message(m) for m in data]
+    
+    async def stream_inbox(
+        self,
+        interval: float = 1.0,
+        auto_ack: bool = True,
+    ) -> AsyncIterator[Message]:
+        """
+        Poll the inbox and yield new messages, oldest first
+        
+        With auto_ack, each message is acknowledged once the consumer has
+        handled it. Otherwise messages already yielded are skipped until
+        they are acknowledged elsewhere.
+        """
+        self._require_agent()
+        seen: Set[str] = set()
+        
+        while True:
+            messages = await self.inbox()
+            if not auto_ack:
+                # Only remember ids still pending, so this stays bounded
+                seen &= {m.id for m in messages}
+            
+            for msg in reversed(messages):
+                if msg.id in seen:
+                    continue
+                yield msg
+                if auto_ack:
+                    await self.ack(msg.id)
+                else:
+                    seen.add(msg.id)
+            
+            await asyncio.sleep(interval)
+    
+    async def history(self, other_id: str, limit: int = 50) -> List[Message]:
+        """Get conversation history"""
+        self._require_agent()
+        data = await self._request_url("GET", self._history_url(other_id, limit))
+        return [_parse_message(m) for m in data]
+    
+    async def ack(self, message_id: str) -> None:
+        """Acknowledge a message"""
+        await self._request("POST", f"/messages/{message_id}/ack")
+    
+    # ═══════════════════════════════════════════════════════════════
+    #                    CONVENIENCE METHODS
+    # ═══════════════════════════════════════════════════════════════
+    
+    async def text(self, to: str, text: str) -> Dict[str, Any]:
+        """Send a text message"""
+        return await self.send(to, "text", {"text": text})
+    
+    async def ping(self, to: str) -> Dict[str, Any]:
+        """Send a ping"""
+        return await self.send(to, "ping", {})
+    
+    async def pong(self, to: str, reply_to: Optional[str] = None) -> Dict[str, Any]:
+        """Send a pong (reply to ping)"""
+        return await self.send(to, "pong", {}, reply_to)
+    
+    async def request(self, to: str, action: str, data: Any = None) -> Dict[str, Any]:
+        """Send a request"""
+        return await self.send(to, "request", {"action": action, "data": data})
+    
+    async def respond(self, to: str, result: Any, reply_to: Optional[str] = None) -> Dict[str, Any]:
+        """Send a response"""
+        return await self.send(to, "response", {"result": result}, reply_to)
+    
+    async def propose(self, to: str, proposal: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a proposal (for signing)"""
+        return await self.send(to, "proposal", proposal)
+    
+    async def signature(self, to: str, sig: str, reply_to: Optional[str] = None) -> Dict[str, Any]:
+        """Send a signature"""
+        return await self.send(to, "signature", {"signature": sig}, reply_to)
+    
+    # ═══════════════════════════════════════════════════════════════
+    #                         INTERNALS
+    # ═══════════════════════════════════════════════════════════════
+    
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make HTTP request to an API path"""
+        return await self._request_url(method, f"{self._base_url}{path}", body)
+    
+    async def _request_url(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make HTTP request to a fully built API URL"""
+        data, headers = self._encode_body(body)
+        
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=60),
+            )
+        
+        try:
+            async with self._session.request(method, url, data=data, headers=headers) as resp:
+                raw = await resp.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            raise PingError(f"Connection failed: {e}", 503) from e
+        return self._decode_response(resp.status, resp.reason or "", raw)
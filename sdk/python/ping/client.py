@@ -1,24 +1,108 @@
 """
 PING Python SDK Client
 
-Zero dependencies (just standard library + optional nacl for Ed25519).
+Zero dependencies (just standard library + optional nacl or cryptography
+for Ed25519 and urllib3 for connection pooling).
 """
 
+import binascii
+import functools
+import io
 import json
-import urllib.request
-import urllib.error
-from typing import Optional, List, Dict, Any
+import sys
+import http.client
+import threading
+import urllib.parse
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import (
+    Optional, List, Dict, Any, Callable, IO, Iterator, Sequence, Tuple, Type, Union,
+)
+from collections import defaultdict
 from dataclasses import dataclass
+from operator import itemgetter
+from types import SimpleNamespace
 import os
+import queue
+import socket
+import time
 
 # Optional: use PyNaCl for Ed25519 if available
 try:
-    from nacl.signing import SigningKey, VerifyKey
-    from nacl.encoding import HexEncoder
+    from nacl.signing import SigningKey
+    from nacl.bindings import crypto_sign
     NACL_AVAILABLE = True
 except ImportError:
     NACL_AVAILABLE = False
 
+# Optional: prefer cryptography's OpenSSL-backed Ed25519 over PyNaCl
+try:
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+    from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+    FAST_ED25519_AVAILABLE = True
+except ImportError:
+    FAST_ED25519_AVAILABLE = False
+
+# Optional: use urllib3 connection pooling if available
+try:
+    import urllib3
+    URLLIB3_AVAILABLE = True
+except ImportError:
+    URLLIB3_AVAILABLE = False
+
+# Optional: use httpx for the opt-in HTTP/2 transport
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Optional: use ijson to parse large inbox responses incrementally
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Optional: use orjson for (de)serialization if available. Both paths emit
+# compact JSON in insertion order, which is what the server re-creates with
+# JSON.stringify when verifying signatures - do not sort keys. Non-str
+# dict keys are written as strings on both, as JSON.stringify does.
+_dumps: Callable[[Any], bytes]
+_loads: Callable[[Union[bytes, str]], Any]
+try:
+    import orjson
+    _dumps = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    _dumps = _json_dumps
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
+
+
+# Failures with no HTTP response (refused, reset, timed out, retries used
+# up); every transport re-raises these as PingError
+_TRANSPORT_ERRORS: Tuple[Type[BaseException], ...] = (OSError, http.client.HTTPException)
+if URLLIB3_AVAILABLE:
+    _TRANSPORT_ERRORS += (urllib3.exceptions.HTTPError,)
+if HTTPX_AVAILABLE:
+    _TRANSPORT_ERRORS += (httpx.TransportError,)
+
+# Queued sends are flushed once this many are waiting, even before flush_ms
+_TX_BATCH_SIZE = 128
+
+# Most get_agent() results kept per client; the oldest are dropped first
+_AGENT_CACHE_SIZE = 1024
+
+# Process-wide urllib3 pool shared by every PingClient that isn't given its
+# own, so many clients (e.g. one per persona) reuse the same connections
+_GLOBAL_POOL: Optional[Any] = None
+_GLOBAL_POOL_LOCK = threading.Lock()
+_POOL_DEFAULTS: Dict[str, Any] = {"num_pools": 16, "maxsize": 32}
+
 
 class PingError(Exception):
     """Error from PING API"""
@@ -27,7 +111,44 @@ class PingError(Exception):
         self.status_code = status_code
 
 
-@dataclass
+def configure_pool(**kwargs: Any) -> Any:
+    """
+    Replace the shared urllib3 PoolManager used by PingClient
+    
+    Keyword arguments are passed to urllib3.PoolManager on top of the
+    defaults (num_pools=16, maxsize=32, 3 retries). Only clients created
+    afterwards use the new pool.
+    """
+    global _GLOBAL_POOL
+    if not URLLIB3_AVAILABLE:
+        raise PingError("urllib3 not installed. Run: pip install ping-a2a[fast]", 500)
+    
+    pool = _new_pool(**kwargs)
+    with _GLOBAL_POOL_LOCK:
+        _GLOBAL_POOL = pool
+    return pool
+
+
+def _new_pool(**kwargs: Any) -> Any:
+    """Build a urllib3 PoolManager with the client defaults"""
+    options = {"retries": urllib3.Retry(3, backoff_factor=0.1), **_POOL_DEFAULTS, **kwargs}
+    return urllib3.PoolManager(**options)
+
+
+def _get_pool() -> Any:
+    """Get the shared urllib3 PoolManager, creating it on first use"""
+    global _GLOBAL_POOL
+    with _GLOBAL_POOL_LOCK:
+        if _GLOBAL_POOL is None:
+            _GLOBAL_POOL = _new_pool()
+        return _GLOBAL_POOL
+
+
+# __slots__ dataclasses (no per-instance __dict__) on Python 3.10+
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Agent:
     id: str
     public_key: str
@@ -39,7 +160,7 @@ class Agent:
     created_at: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Message:
     id: str
     type: str
@@ -53,7 +174,7 @@ class Message:
     acknowledged: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Contact:
     contact_id: str
     alias: Optional[str]
@@ -62,117 +183,437 @@ class Contact:
     contact: Optional[Dict[str, Any]]
 
 
-class PingClient:
-    """
-    PING SDK Client
-    
-    Example:
-        client = PingClient()
-        client.generate_keys()
-        agent = client.register(name="My Agent")
-        client.text(recipient_id, "Hello!")
-        messages = client.inbox()
-    """
+def _parse_agent(data: Dict[str, Any]) -> Agent:
+    """Build an Agent from an API response"""
+    get = data.get
+    return Agent(
+        id=data["id"],
+        public_key=data["publicKey"],
+        name=data["name"],
+        provider=data["provider"],
+        capabilities=get("capabilities", []),
+        webhook_url=get("webhookUrl"),
+        is_public=get("isPublic", False),
+        created_at=get("createdAt", ""),
+    )
+
+
+# Wire keys in Message/Contact field order, pulled out in one C-level call.
+# Optional keys are filled from the defaults first ("payload" gets a fresh
+# dict per message so instances never share one).
+_MESSAGE_DEFAULTS: Dict[str, Any] = {
+    "replyTo": None,
+    "timestamp": "",
+    "signature": "",
+    "delivered": False,
+    "acknowledged": False,
+}
+_MESSAGE_FIELDS = itemgetter(
+    "id", "type", "from", "to", "payload", "replyTo",
+    "timestamp", "signature", "delivered", "acknowledged",
+)
+
+_CONTACT_DEFAULTS: Dict[str, Any] = {
+    "alias": None,
+    "notes": None,
+    "addedAt": "",
+    "contact": None,
+}
+_CONTACT_FIELDS = itemgetter("contactId", "alias", "notes", "addedAt", "contact")
+
+
+def _index_directory(agents: List[Dict[str, Any]]) -> SimpleNamespace:
+    """Index directory entries by provider and by capability in one pass"""
+    by_capability: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    by_provider: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for a in agents:
+        by_provider[a.get("provider", "")].append(a)
+        for capability in a.get("capabilities") or ():
+            by_capability[capability].append(a)
+    return SimpleNamespace(by_capability=by_capability, by_provider=by_provider, all=agents)
+
+
+def _parse_message(m: Dict[str, Any]) -> Message:
+    """Build a Message from an API response"""
+    return Message(*_MESSAGE_FIELDS({**_MESSAGE_DEFAULTS, "payload": {}, **m}))
+
+
+def _parse_contact(c: Dict[str, Any]) -> Contact:
+    """Build a Contact from an API response"""
+    return Contact(*_CONTACT_FIELDS({**_CONTACT_DEFAULTS, **c}))
+
+
+class _BaseClient:
+    """Keys, agent ID/URLs and request building shared by PingClient and AsyncPingClient"""
     
     def __init__(
         self,
         base_url: str = "http://localhost:3100",
         private_key: Optional[str] = None,
         agent_id: Optional[str] = None,
+        agent_cache_ttl: float = 60.0,
     ):
-        self.base_url = base_url.rstrip("/")
-        self.agent_id = agent_id or ""
+        self._base_url = base_url.rstrip("/")
+        self._agent_id = agent_id or ""
+        self._update_urls()
         self._signing_key: Optional[Any] = None
+        self._sign_raw: Optional[Callable[[bytes], bytes]] = None
+        self._signing_key_raw = b""
+        self._public_key_bytes = b""
         self._public_key = ""
         
+        # get_agent() results by agent ID, as (fetched_at, agent), oldest first
+        self._agent_cache: Dict[str, Tuple[float, Agent]] = {}
+        self._agent_cache_ttl = agent_cache_ttl
+        
         if private_key:
             self.set_keys(private_key)
     
+    @property
+    def base_url(self) -> str:
+        """API base URL"""
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        self._base_url = value.rstrip("/")
+        self._update_urls()
+    
+    @property
+    def agent_id(self) -> str:
+        """This client's agent ID ("" until registered)"""
+        return self._agent_id
+    
+    @agent_id.setter
+    def agent_id(self, value: str) -> None:
+        self._agent_id = value
+        self._update_urls()
+    
+    def _update_urls(self) -> None:
+        """Pre-render the URLs used on every call for this agent"""
+        base = self._base_url
+        self._messages_url = f"{base}/messages"
+        self._agent_url = f"{base}/agents/{self._agent_id}"
+        self._inbox_url = f"{self._agent_url}/inbox"
+        self._contacts_url = f"{self._agent_url}/contacts"
+    
     # ═══════════════════════════════════════════════════════════════
     #                         KEYS
     # ═══════════════════════════════════════════════════════════════
     
     def generate_keys(self) -> Dict[str, str]:
         """Generate a new Ed25519 keypair"""
-        if not NACL_AVAILABLE:
-            raise PingError("PyNaCl not installed. Run: pip install pynacl", 500)
-        
-        self._signing_key = SigningKey.generate()
-        self._public_key = self._signing_key.verify_key.encode(encoder=HexEncoder).decode()
+        self._require_ed25519()
+        self._load_signing_key(os.urandom(32))
         
         return {
-            "private_key": self._signing_key.encode(encoder=HexEncoder).decode(),
+            "private_key": binascii.hexlify(self._signing_key_raw).decode(),
             "public_key": self._public_key,
         }
     
     def set_keys(self, private_key: str) -> None:
         """Set keys from existing private key"""
-        if not NACL_AVAILABLE:
-            raise PingError("PyNaCl not installed. Run: pip install pynacl", 500)
-        
-        self._signing_key = SigningKey(private_key, encoder=HexEncoder)
-        self._public_key = self._signing_key.verify_key.encode(encoder=HexEncoder).decode()
+        self._require_ed25519()
+        self._load_signing_key(binascii.unhexlify(private_key))
     
     @property
     def public_key(self) -> str:
         """Get the public key"""
         return self._public_key
     
+    def _load_signing_key(self, seed: bytes) -> None:
+        """Load a 32-byte Ed25519 seed into the fastest available backend"""
+        signing_key: Any
+        if FAST_ED25519_AVAILABLE:
+            signing_key = Ed25519PrivateKey.from_private_bytes(seed)
+            public_key_bytes = signing_key.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)
+            self._sign_raw = signing_key.sign
+        else:
+            signing_key = SigningKey(seed)
+            public_key_bytes = signing_key.verify_key.encode()
+            # libsodium's secret key form (seed || public key); calling the
+            # binding directly skips SigningKey.sign's SignedMessage wrapper
+            sk_bytes = seed + public_key_bytes
+            self._sign_raw = lambda msg_bytes: crypto_sign(msg_bytes, sk_bytes)[:64]
+        
+        self._signing_key = signing_key
+        self._signing_key_raw = seed
+        self._public_key_bytes = public_key_bytes
+        self._public_key = binascii.hexlify(public_key_bytes).decode()
+    
     # ═══════════════════════════════════════════════════════════════
-    #                         AGENTS
+    #                    REQUEST BUILDING
     # ═══════════════════════════════════════════════════════════════
     
-    def register(
+    @staticmethod
+    def _encode_body(body: Optional[Dict[str, Any]]) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """Serialize a JSON request body, return (data, headers)"""
+        if body is None:
+            return None, {}
+        return _dumps(body), {"Content-Type": "application/json"}
+    
+    @staticmethod
+    def _decode_response(status: int, reason: str, raw: bytes) -> Any:
+        """Parse a JSON response, raising PingError for error statuses"""
+        if status >= 400:
+            message = f"HTTP Error {status}: {reason}"
+            try:
+                error_data = _loads(raw)
+            except ValueError:
+                raise PingError(message, status)
+            if isinstance(error_data, dict):
+                message = error_data.get("error", message)
+            raise PingError(message, status)
+        
+        return _loads(raw)
+    
+    def _registration(
         self,
         name: str,
-        provider: str = "python",
-        capabilities: Optional[List[str]] = None,
-        webhook_url: Optional[str] = None,
-        is_public: bool = False,
-    ) -> Agent:
-        """Register as a new agent"""
+        provider: str,
+        capabilities: Optional[List[str]],
+        webhook_url: Optional[str],
+        is_public: bool,
+    ) -> Dict[str, Any]:
+        """Build the POST /agents body, generating keys if needed"""
         if not self._public_key:
             self.generate_keys()
         
-        data = self._request("POST", "/agents", {
+        return {
             "publicKey": self._public_key,
             "name": name,
             "provider": provider,
             "capabilities": capabilities or [],
             "webhookUrl": webhook_url,
             "isPublic": is_public,
+        }
+    
+    def _cached_agent(self, agent_id: str) -> Optional[Agent]:
+        """Return a cached agent if it is still fresh, dropping it if stale"""
+        entry = self._agent_cache.get(agent_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] < self._agent_cache_ttl:
+            return entry[1]
+        self._agent_cache.pop(agent_id, None)
+        return None
+    
+    def _cache_agent(self, agent: Agent) -> Agent:
+        """Remember an agent for get_agent(), evicting stale and excess entries"""
+        cache = self._agent_cache
+        now = time.monotonic()
+        # Re-inserted at the end so the dict stays ordered by fetch time
+        cache.pop(agent.id, None)
+        while cache:
+            oldest_id, (fetched_at, _) = next(iter(cache.items()))
+            if len(cache) < _AGENT_CACHE_SIZE and now - fetched_at < self._agent_cache_ttl:
+                break
+            cache.pop(oldest_id, None)
+        cache[agent.id] = (now, agent)
+        return agent
+    
+    def _search_path(
+        self,
+        query: Optional[str],
+        capability: Optional[str],
+        provider: Optional[str],
+    ) -> str:
+        """Build the /directory/search path with escaped query params"""
+        qs = urllib.parse.urlencode({
+            k: v
+            for k, v in (("q", query), ("capability", capability), ("provider", provider))
+            if v
         })
         
+        path = "/directory/search"
+        if qs:
+            path += "?" + qs
+        return path
+    
+    def _inbox_request_url(self, include_all: bool) -> str:
+        """Inbox URL, optionally including acknowledged messages"""
+        return self._inbox_url + "?all=true" if include_all else self._inbox_url
+    
+    def _history_url(self, other_id: str, limit: int) -> str:
+        """Conversation history URL with another agent"""
+        qs = urllib.parse.urlencode({"limit": limit})
+        return f"{self._agent_url}/messages/{other_id}?{qs}"
+    
+    def _build_message(
+        self,
+        to: str,
+        msg_type: str,
+        payload: Optional[Dict[str, Any]] = None,
+        reply_to: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build and sign a message for POST /messages"""
+        message = {
+            "type": msg_type,
+            "from": self._agent_id,
+            "to": to,
+            "payload": payload or {},
+            "replyTo": reply_to,
+            "timestamp": time.time_ns() // 1_000_000,
+        }
+        
+        message["signature"] = self._sign_bytes(_dumps(message))
+        return message
+    
+    def _sign(self, message: Dict[str, Any]) -> str:
+        """Sign a message with Ed25519"""
+        return self._sign_bytes(_dumps(message))
+    
+    def _sign_bytes(self, msg_bytes: bytes) -> str:
+        """Sign already-serialized message bytes with Ed25519"""
+        sign_raw = self._sign_raw
+        if sign_raw is None:
+            raise PingError("Must generate or set keys first", 400)
+        return binascii.hexlify(sign_raw(msg_bytes)).decode()
+    
+    def _require_agent(self) -> None:
+        """Ensure agent is registered"""
+        if not self.agent_id:
+            raise PingError("Must register first (call register())", 400)
+    
+    def _require_ed25519(self) -> None:
+        """Ensure an Ed25519 backend is installed"""
+        if not FAST_ED25519_AVAILABLE and not NACL_AVAILABLE:
+            raise PingError("PyNaCl not installed. Run: pip install pynacl", 500)
+    
+    def _require_keys(self) -> None:
+        """Ensure keys are set"""
+        if not self._signing_key:
+            raise PingError("Must generate or set keys first", 400)
+
+
+class PingClient(_BaseClient):
+    """
+    PING SDK Client
+    
+    Example:
+        client = PingClient()
+        client.generate_keys()
+        agent = client.register(name="My Agent")
+        client.text(recipient_id, "Hello!")
+        messages = client.inbox()
+    """
+    
+    def __init__(
+        self,
+        base_url: str = "http://localhost:3100",
+        private_key: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        transport: str = "http1",
+        flush_ms: float = 5.0,
+        agent_cache_ttl: float = 60.0,
+        warmup: bool = False,
+        pool: Optional[Any] = None,
+    ):
+        super().__init__(base_url, private_key, agent_id, agent_cache_ttl)
+        
+        # Keep-alive HTTP: an httpx HTTP/2 client if asked for, else the
+        # given (or shared) urllib3 pool if installed, otherwise one stdlib
+        # connection per thread (see _http_request)
+        self._http: Optional[Any] = None
+        self._http2: Optional[Any] = None
+        self._local = threading.local()
+        if transport == "http2":
+            if pool is not None:
+                raise PingError("pool is only used by the http1 transport", 400)
+            if not HTTPX_AVAILABLE:
+                raise PingError("httpx not installed. Run: pip install ping-a2a[http2]", 500)
+            try:
+                self._http2 = httpx.Client(
+                    http2=True,
+                    timeout=30,
+                    limits=httpx.Limits(max_connections=8),
+                )
+            except ImportError:
+                # httpx without its http2 extra (the h2 package)
+                raise PingError("h2 not installed. Run: pip install ping-a2a[http2]", 500) from None
+        elif transport != "http1":
+            raise PingError(f"Unknown transport: {transport} (expected http1 or http2)", 400)
+        elif pool is not None:
+            self._http = pool
+        elif URLLIB3_AVAILABLE:
+            self._http = _get_pool()
+        
+        # Outbound queue for enqueue(); the flusher thread
+        # is started on first use and stopped by close() (a None on the queue)
+        self._flush_ms = flush_ms
+        self._tx_queue: "queue.SimpleQueue[Optional[Tuple[Dict[str, Any], Future]]]" = queue.SimpleQueue()
+        self._tx_cond = threading.Condition()
+        self._tx_pending = 0
+        self._tx_thread: Optional[threading.Thread] = None
+        self._tx_closed = False
+        
+        # Workers for send_many() and queued flushes, created on first use and
+        # kept so their keep-alive connections (per thread on http.client)
+        # are reused from one batch to the next
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
+        if warmup:
+            self._warmup()
+    
+    def close(self) -> None:
+        """Send queued messages, then close the client's own connections and worker threads"""
+        self.flush()
+        with self._tx_cond:
+            self._tx_closed = True
+            thread, self._tx_thread = self._tx_thread, None
+            if thread is not None:
+                self._tx_queue.put(None)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        
+        # The shared urllib3 pool (or one passed as pool=) is left open
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._http2 is not None:
+            self._http2.close()
+        self._close_connection()
+    
+    def __enter__(self) -> "PingClient":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    # ═══════════════════════════════════════════════════════════════
+    #                         AGENTS
+    # ═══════════════════════════════════════════════════════════════
+    
+    def register(
+        self,
+        name: str,
+        provider: str = "python",
+        capabilities: Optional[List[str]] = None,
+        webhook_url: Optional[str] = None,
+        is_public: bool = False,
+    ) -> Agent:
+        """Register as a new agent"""
+        data = self._request("POST", "/agents", self._registration(
+            name, provider, capabilities, webhook_url, is_public,
+        ))
+        
         self.agent_id = data["id"]
-        return Agent(
-            id=data["id"],
-            public_key=data["publicKey"],
-            name=data["name"],
-            provider=data["provider"],
-            capabilities=data.get("capabilities", []),
-            webhook_url=data.get("webhookUrl"),
-            is_public=data.get("isPublic", False),
-            created_at=data.get("createdAt", ""),
-        )
+        return _parse_agent(data)
     
     def get_agent(self, agent_id: str) -> Agent:
-        """Get agent info by ID"""
-        data = self._request("GET", f"/agents/{agent_id}")
-        return Agent(
-            id=data["id"],
-            public_key=data["publicKey"],
-            name=data["name"],
-            provider=data["provider"],
-            capabilities=data.get("capabilities", []),
-            webhook_url=data.get("webhookUrl"),
-            is_public=data.get("isPublic", False),
-            created_at=data.get("createdAt", ""),
-        )
+        """Get agent info by ID (cached for agent_cache_ttl seconds)"""
+        agent = self._cached_agent(agent_id)
+        if agent is None:
+            data = self._request("GET", f"/agents/{agent_id}")
+            agent = self._cache_agent(_parse_agent(data))
+        return agent
     
     def delete_agent(self) -> None:
         """Delete this agent"""
         self._require_agent()
-        self._request("DELETE", f"/agents/{self.agent_id}")
+        self._request_url("DELETE", self._agent_url)
+        self._agent_cache.pop(self._agent_id, None)
         self.agent_id = ""
     
     # ═══════════════════════════════════════════════════════════════
@@ -183,6 +624,15 @@ class PingClient:
         """List public agents"""
         return self._request("GET", "/directory")
     
+    def directory_index(self) -> SimpleNamespace:
+        """
+        List public agents indexed for repeated lookups
+        
+        Returns a namespace with by_capability and by_provider (dicts of
+        lists, empty for unknown keys) plus all (the plain directory list).
+        """
+        return _index_directory(self.directory())
+    
     def search(
         self,
         query: Optional[str] = None,
@@ -190,19 +640,7 @@ class PingClient:
         provider: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Search agents"""
-        params = []
-        if query:
-            params.append(f"q={query}")
-        if capability:
-            params.append(f"capability={capability}")
-        if provider:
-            params.append(f"provider={provider}")
-        
-        path = "/directory/search"
-        if params:
-            path += "?" + "&".join(params)
-        
-        return self._request("GET", path)
+        return self._request("GET", self._search_path(query, capability, provider))
     
     # ═══════════════════════════════════════════════════════════════
     #                         CONTACTS
@@ -211,17 +649,8 @@ class PingClient:
     def contacts(self) -> List[Contact]:
         """Get contacts"""
         self._require_agent()
-        data = self._request("GET", f"/agents/{self.agent_id}/contacts")
-        return [
-            Contact(
-                contact_id=c["contactId"],
-                alias=c.get("alias"),
-                notes=c.get("notes"),
-                added_at=c.get("addedAt", ""),
-                contact=c.get("contact"),
-            )
-            for c in data
-        ]
+        data = self._request_url("GET", self._contacts_url)
+        return [_parse_contact(c) for c in data]
     
     def add_contact(
         self,
@@ -231,7 +660,7 @@ class PingClient:
     ) -> None:
         """Add a contact"""
         self._require_agent()
-        self._request("POST", f"/agents/{self.agent_id}/contacts", {
+        self._request_url("POST", self._contacts_url, {
             "contactId": contact_id,
             "alias": alias,
             "notes": notes,
@@ -240,7 +669,7 @@ class PingClient:
     def remove_contact(self, contact_id: str) -> None:
         """Remove a contact"""
         self._require_agent()
-        self._request("DELETE", f"/agents/{self.agent_id}/contacts/{contact_id}")
+        self._request_url("DELETE", f"{self._contacts_url}/{contact_id}")
     
     # ═══════════════════════════════════════════════════════════════
     #                         MESSAGES
@@ -257,65 +686,102 @@ class PingClient:
         self._require_agent()
         self._require_keys()
         
-        import time
+        message = self._build_message(to, msg_type, payload, reply_to)
+        return self._request_url("POST", self._messages_url, message)
+    
+    def enqueue(
+        self,
+        to: str,
+        msg_type: str,
+        payload: Optional[Dict[str, Any]] = None,
+        reply_to: Optional[str] = None,
+    ) -> "Future[Dict[str, Any]]":
+        """
+        Queue a message instead of sending it right away
         
-        message = {
-            "type": msg_type,
-            "from": self.agent_id,
-            "to": to,
-            "payload": payload or {},
-            "replyTo": reply_to,
-            "timestamp": int(time.time() * 1000),
-        }
+        The message is signed now, and a Future for the send() result is
+        returned. Queued messages go out together after flush_ms, or as
+        soon as 128 are waiting; call flush() to send them right away
+        (e.g. before exiting).
+        """
+        self._require_agent()
+        self._require_keys()
         
-        signature = self._sign(message)
+        message = self._build_message(to, msg_type, payload, reply_to)
+        future: "Future[Dict[str, Any]]" = Future()
+        with self._tx_cond:
+            if self._tx_closed:
+                raise PingError("Client is closed", 400)
+            self._tx_pending += 1
+            if self._tx_thread is None:
+                self._tx_thread = threading.Thread(
+                    target=self._tx_loop, name="ping-tx", daemon=True
+                )
+                self._tx_thread.start()
+            self._tx_queue.put((message, future))
+        return future
+    
+    def flush(self) -> None:
+        """Send all queued messages and wait until they are posted"""
+        batch = []
+        while True:
+            try:
+                item = self._tx_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # close() is stopping the flusher; leave that to it
+                self._tx_queue.put(None)
+                break
+            batch.append(item)
+        if batch:
+            self._post_queued(batch)
         
-        return self._request("POST", "/messages", {
-            **message,
-            "signature": signature,
-        })
+        # On the flusher thread (a done-callback) the batch being resolved
+        # is still pending, and only this thread could post the rest
+        if threading.current_thread() is self._tx_thread:
+            return
+        with self._tx_cond:
+            self._tx_cond.wait_for(lambda: self._tx_pending == 0)
     
-    def inbox(self, include_all: bool = False) -> List[Message]:
-        """Get inbox (unacknowledged messages)"""
+    def send_many(self, targets: Sequence[Tuple[Any, ...]]) -> List[Dict[str, Any]]:
+        """
+        Send several messages at once
+        
+        Each target is a (to, msg_type[, payload[, reply_to]]) tuple. All
+        messages are signed up front, then posted concurrently over the
+        shared keep-alive connections. Results are in submission order.
+        """
         self._require_agent()
-        path = f"/agents/{self.agent_id}/inbox"
-        if include_all:
-            path += "?all=true"
+        self._require_keys()
         
-        data = self._request("GET", path)
-        return [
-            Message(
-                id=m["id"],
-                type=m["type"],
-                from_agent=m["from"],
-                to_agent=m["to"],
-                payload=m.get("payload", {}),
-                reply_to=m.get("replyTo"),
-                timestamp=m.get("timestamp", ""),
-                signature=m.get("signature", ""),
-                delivered=m.get("delivered", False),
-                acknowledged=m.get("acknowledged", False),
-            )
-            for m in data
-        ]
+        messages = [self._build_message(*target) for target in targets]
+        return [f.result() for f in self._post_messages(messages)]
+    
+    def inbox(
+        self,
+        include_all: bool = False,
+        stream: bool = False,
+    ) -> Union[List[Message], Iterator[Message]]:
+        """
+        Get inbox (unacknowledged messages)
+        
+        With stream=True, returns an iterator that parses messages off the
+        response as they arrive (using ijson if installed), so memory stays
+        flat for very large inboxes.
+        """
+        self._require_agent()
+        if stream:
+            return self._stream_messages(self._inbox_request_url(include_all))
+        
+        data = self._request_url("GET", self._inbox_request_url(include_all))
+        return [_parse_message(m) for m in data]
     
     def history(self, other_id: str, limit: int = 50) -> List[Message]:
         """Get conversation history"""
         self._require_agent()
-        data = self._request("GET", f"/agents/{self.agent_id}/messages/{other_id}?limit={limit}")
-        return [
-            Message(
-                id=m["id"],
-                type=m["type"],
-                from_agent=m["from"],
-                to_agent=m["to"],
-                payload=m.get("payload", {}),
-                reply_to=m.get("replyTo"),
-                timestamp=m.get("timestamp", ""),
-                signature=m.get("signature", ""),
-            )
-            for m in data
-        ]
+        data = self._request_url("GET", self._history_url(other_id, limit))
+        return [_parse_message(m) for m in data]
     
     def ack(self, message_id: str) -> None:
         """Acknowledge a message"""
@@ -363,40 +829,233 @@ class PingClient:
         path: str,
         body: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        """Make HTTP request to API"""
-        url = f"{self.base_url}{path}"
-        
-        data = None
-        headers = {}
+        """Make HTTP request to an API path"""
+        return self._request_url(method, f"{self._base_url}{path}", body)
+    
+    def _request_url(
+        self,
+        method: str,
+        url: str,
+        body: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Make HTTP request to a fully built API URL"""
+        data, headers = self._encode_body(body)
+        status, reason, raw = self._http_request(method, url, data, headers)
+        return self._decode_response(status, reason, raw)
+    
+    def _http_request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[bytes],
+        headers: Dict[str, str],
+    ) -> Tuple[int, str, bytes]:
+        """Send a request over a kept-alive connection, return (status, reason, body)"""
+        try:
+            if self._http2 is not None:
+                if self._http2.is_closed:
+                    raise PingError("Client is closed", 400)
+                r = self._http2.request(method, url, content=data, headers=headers)
+                return r.status_code, r.reason_phrase, r.content
+            
+            if self._http is not None:
+                resp = self._http.request(
+                    method, url, body=data, headers=headers, preload_content=True
+                )
+                return resp.status, resp.reason or "", resp.data
+            
+            resp = self._stdlib_response(method, url, data, headers)
+            try:
+                return resp.status, resp.reason, resp.read()
+            except Exception:
+                self._close_connection()
+                raise
+        except _TRANSPORT_ERRORS as e:
+            raise PingError(f"Connection failed: {e}", 503) from e
+    
+    def _stdlib_response(
+        self,
+        method: str,
+        url: str,
+        data: Optional[bytes],
+        headers: Dict[str, str],
+    ) -> http.client.HTTPResponse:
+        """Send a request on this thread's stdlib connection, return the unread response"""
+        # Reuse this thread's connection, reconnecting only when the server
+        # has dropped the idle keep-alive socket
+        parts = urllib.parse.urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
         
-        if body is not None:
-            data = json.dumps(body).encode("utf-8")
-            headers["Content-Type"] = "application/json"
+        for attempt in range(2):
+            conn = self._connection(parts.scheme, parts.netloc)
+            try:
+                conn.request(method, target, body=data, headers=headers)
+                return conn.getresponse()
+            except http.client.BadStatusLine:
+                # Includes RemoteDisconnected
+                self._close_connection()
+                if attempt:
+                    raise
+            except Exception:
+                self._close_connection()
+                raise
+        raise AssertionError("unreachable")
+    
+    @contextmanager
+    def _stream_url(self, url: str) -> Iterator[IO[bytes]]:
+        """GET a URL and yield its body as an unread file-like object"""
+        if self._http2 is not None:
+            # Not streamed: httpx responses are not file-like
+            status, reason, raw = self._http_request("GET", url, None, {})
+            if status >= 400:
+                self._decode_response(status, reason, raw)
+            yield io.BytesIO(raw)
+            return
         
-        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+        if self._http is not None:
+            resp = self._http.request("GET", url, preload_content=False)
+            try:
+                if resp.status >= 400:
+                    self._decode_response(resp.status, resp.reason or "", resp.read())
+                yield resp
+            finally:
+                # Finish reading an abandoned body so the socket can be reused
+                resp.drain_conn()
+                resp.release_conn()
+            return
         
+        resp = self._stdlib_response("GET", url, None, {})
+        # Detach the connection while the body is streamed, so other calls on
+        # this thread (e.g. ack() per message) open their own meanwhile
+        conn, key = self._local.conn, self._local.key
+        self._local.conn = None
         try:
-            with urllib.request.urlopen(req) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except urllib.error.HTTPError as e:
-            try:
-                error_data = json.loads(e.read().decode("utf-8"))
-                raise PingError(error_data.get("error", str(e)), e.code)
-            except json.JSONDecodeError:
-                raise PingError(str(e), e.code)
+            if resp.status >= 400:
+                self._decode_response(resp.status, resp.reason, resp.read())
+            yield resp
+        finally:
+            if resp.isclosed() and self._local.conn is None:
+                # Body fully read: hand the connection back for reuse
+                self._local.conn, self._local.key = conn, key
+            else:
+                conn.close()
     
-    def _sign(self, message: Dict[str, Any]) -> str:
-        """Sign a message with Ed25519"""
-        msg_bytes = json.dumps(message).encode("utf-8")
-        signed = self._signing_key.sign(msg_bytes)
-        return signed.signature.hex()
+    def _stream_messages(self, url: str) -> Iterator[Message]:
+        """Yield messages from a JSON array response as they are parsed"""
+        try:
+            with self._stream_url(url) as body:
+                if IJSON_AVAILABLE:
+                    items = ijson.items(body, "item", use_float=True)
+                else:
+                    items = _loads(body.read())
+                for m in items:
+                    yield _parse_message(m)
+        except _TRANSPORT_ERRORS as e:
+            raise PingError(f"Connection failed: {e}", 503) from e
     
-    def _require_agent(self) -> None:
-        """Ensure agent is registered"""
-        if not self.agent_id:
-            raise PingError("Must register first (call register())", 400)
+    def _warmup(self) -> None:
+        """Open the API connection up front (DNS, TCP, TLS); errors are ignored"""
+        url = f"{self._base_url}/health"
+        try:
+            if self._http2 is not None:
+                self._http2.get(url, timeout=2)
+            elif self._http is not None:
+                self._http.request("GET", url, timeout=2.0, retries=False)
+            else:
+                parts = urllib.parse.urlsplit(url)
+                conn = self._connection(parts.scheme, parts.netloc)
+                timeout, conn.timeout = conn.timeout, 2
+                try:
+                    conn.connect()
+                finally:
+                    conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(socket.getdefaulttimeout())
+        except Exception:
+            self._close_connection()
     
-    def _require_keys(self) -> None:
-        """Ensure keys are set"""
-        if not self._signing_key:
-            raise PingError("Must generate or set keys first", 400)
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """Get (or open) this thread's keep-alive connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.key == (scheme, netloc):
+            return conn
+        
+        self._close_connection()
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(netloc)
+        else:
+            conn = http.client.HTTPConnection(netloc)
+        self._local.conn = conn
+        self._local.key = (scheme, netloc)
+        return conn
+    
+    def _close_connection(self) -> None:
+        """Drop this thread's keep-alive connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
+    def _post_messages(self, messages: List[Dict[str, Any]]) -> List["Future[Any]"]:
+        """POST signed messages concurrently, return completed futures in order"""
+        if not messages:
+            return []
+        
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="ping-send")
+        
+        futures = [
+            self._executor.submit(self._request_url, "POST", self._messages_url, message)
+            for message in messages
+        ]
+        wait(futures)
+        return futures
+    
+    def _tx_loop(self) -> None:
+        """Flusher thread: coalesce queued sends for up to flush_ms, until close()"""
+        stop = False
+        while not stop:
+            item = self._tx_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self._flush_ms / 1000
+            while len(batch) < _TX_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._tx_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._post_queued(batch)
+    
+    def _post_queued(self, batch: List[Tuple[Dict[str, Any], Future]]) -> None:
+        """Post a batch of queued sends and resolve their futures"""
+        try:
+            done = self._post_messages([message for message, _ in batch])
+        except Exception as e:
+            failed: Future = Future()
+            failed.set_exception(e)
+            done = [failed] * len(batch)
+        finally:
+            with self._tx_cond:
+                self._tx_pending -= len(batch)
+                self._tx_cond.notify_all()
+        
+        # Resolved only once no longer pending, so done-callbacks that call
+        # flush() don't wait on their own batch
+        for (_, future), result in zip(batch, done):
+            error = result.exception()
+            if error is None:
+                future.set_result(result.result())
+            else:
+                future.set_exception(error)